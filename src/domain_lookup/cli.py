@@ -9,114 +9,948 @@ and provides real-time feedback.
 import sys
 import re
 import time
-import whois
-from datetime import datetime
+import atexit
+import shelve
+import socket
+import argparse
+import asyncio
+import threading
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from queue import SimpleQueue
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from types import SimpleNamespace
+
+WHOIS_TIMEOUT = 10
+LOOKUP_TIMEOUT = 15
+DNS_TIMEOUT = 2
+WHOIS_RETRIES = 3
+WHOIS_RETRY_DELAY = 1.0
+OUTPUT_FLUSH_LINES = 32
+MAX_CONCURRENT_LOOKUPS = 8
+DEFAULT_WORKERS = 16
+CACHE_TTL = 3 * 86400
+CACHE_MAX_ENTRIES = 4096
+CACHE_PATH = Path.home() / ".domain_lookup_cache"
+HISTORY_PATH = Path.home() / ".domain_lookup_history"
+RDAP_BOOTSTRAP_PATH = Path.home() / ".domain_lookup_rdap.json"
+RDAP_BOOTSTRAP_MAX_AGE = 7
+
+# Minimum seconds between queries to the same TLD's WHOIS server. Registries
+# rate-limit per server, so each TLD gets its own schedule.
+_TLD_MIN_INTERVAL = {"com": 0.05, "net": 0.05, "org": 0.1, "de": 1.0, "cz": 2.0}
+DEFAULT_MIN_INTERVAL = 0.25
+# Earliest monotonic time the next query to each TLD may be sent
+_NEXT_QUERY = defaultdict(float)
+_rate_lock = threading.Lock()
+# Runs the DNS probe of a synchronous lookup while the calling thread does
+# WHOIS; threads are only started once the first probe is submitted.
+# _run_threaded swaps in one sized to its --workers.
+_DNS_EXECUTOR = ThreadPoolExecutor(max_workers=DEFAULT_WORKERS, thread_name_prefix="dns-probe")
+
+# Public Suffix List snapshot bundled with tldextract: no network fetch or
+# disk cache on first use, and parsed once per process
+_EXTRACT = None
+_extract_lock = threading.Lock()
+
+# Results keyed by registered domain: {key: (timestamp, domain, result)},
+# least recently used first and capped at CACHE_MAX_ENTRIES
+_WHOIS_CACHE = OrderedDict()
+_disk_cache = None
+# Set once this process stores a result, so exit knows to prune the file
+_disk_cache_dirty = False
+_cache_lock = threading.Lock()
+# Lookups under way, keyed like the cache: {key: future of (domain, result)}.
+# Repeats and sibling subdomains wait on the running lookup instead of
+# starting their own.
+_in_flight = {}
+_in_flight_async = {}
+# None until the first RDAP lookup tries to load IANA's bootstrap data
+_rdap_available = None
+_rdap_lock = threading.Lock()
+
+# Standard domain names: labels of up to 63 characters, TLD of 2-10 letters
+# or an xn-- (punycode) TLD of up to 63 characters
+_DOMAIN_RE = re.compile(r'([a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?\.)+([a-zA-Z]{2,10}|xn--[a-zA-Z0-9\-]{1,59})')
+# WHOIS error phrases meaning "no such domain" and "registered but hidden"
+# (lowercase; matched as substrings of the lowercased message, which is far
+# cheaper than a case-insensitive regex over multi-KB legal boilerplate)
+_AVAIL_PHRASES = ("no match", "no entries found", "not found", "no data found", "domain available")
+_PRIV_PHRASES = ("redacted for privacy", "registration private", "data protected")
+# Responses from a WHOIS server that is throttling us rather than answering;
+# only the start of a response is checked, so legal boilerplate can't match
+_RATE_LIMIT_RE = re.compile(r"rate limit|limit exceeded|quota exceeded|too many (requests|queries|connections)|try again later", re.I)
+# Every field we report from a Verisign registry answer, picked out in one
+# scan of the response (Name Server and Domain Status repeat)
+_VERISIGN_FIELD_RE = re.compile(
+    r"^[ \t]*(?P<field>Domain Name|Creation Date|Registry Expiry Date|Registrar|Domain Status|Name Server):"
+    r"[ \t]*(?P<value>\S[^\r\n]*)", re.M)
+
+# WHOIS server per public suffix, as chosen by python-whois. Remembering it
+# saves a whois.iana.org round trip on every lookup for TLDs missing from
+# python-whois's built-in table (.org, .io, .de, ...).
+_WHOIS_SERVERS = {}
+
+class _Result(tuple):
+    """
+    An (is_available, message) pair that also carries the registration
+    fields it was built from, for --json output.
+    """
+    def __new__(cls, is_available, message, **details):
+        self = super().__new__(cls, (is_available, message))
+        self.details = details
+        return self
+
+    def __reduce__(self):
+        # Pickled into the shelve cache; restore details as instance state
+        return (self.__class__, tuple(self), self.__dict__)
 
 def validate_domain(domain):
-    # Regular expression pattern for domain validation
-    pattern = r'^([a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?\.)+[a-zA-Z]{2,10}$'
-    return bool(re.match(pattern, domain))
-
-def check_domain_availability(domain):
-    try:
-        domain_info = whois.whois(domain)
-        if domain_info.domain_name is None:
-            return True, f"Domain {domain} appears to be available (No domain record found)"
-        registration_details = []
-        creation_date = None
-        if domain_info.creation_date:
-            if isinstance(domain_info.creation_date, list):
-                creation_date = domain_info.creation_date[0]
-            else:
-                creation_date = domain_info.creation_date
-            if isinstance(creation_date, datetime):
-                registration_details.append(f"Created: {creation_date.strftime('%Y-%m-%d')}")
-        expiration_date = None
-        if domain_info.expiration_date:
-            if isinstance(domain_info.expiration_date, list):
-                expiration_date = domain_info.expiration_date[0]
-            else:
-                expiration_date = domain_info.expiration_date
-            if isinstance(expiration_date, datetime):
-                registration_details.append(f"Expires: {expiration_date.strftime('%Y-%m-%d')}")
-                if expiration_date < datetime.now():
-                    return True, f"Domain {domain} expired on {expiration_date.strftime('%Y-%m-%d')} and may be available for registration"
-        registrar = "Unknown registrar"
-        if domain_info.registrar:
-            registrar = domain_info.registrar
-            registration_details.append(f"Registrar: {registrar}")
-        if domain_info.name_servers:
-            ns_count = len(domain_info.name_servers) if isinstance(domain_info.name_servers, list) else 1
-            registration_details.append(f"Nameservers: {ns_count} configured")
-        if hasattr(domain_info, 'status') and domain_info.status:
-            if isinstance(domain_info.status, list):
-                statuses = ", ".join(domain_info.status[:2])
-                if len(domain_info.status) > 2:
-                    statuses += f" and {len(domain_info.status)-2} more"
-            else:
-                statuses = domain_info.status
-            registration_details.append(f"Status: {statuses}")
-        if registration_details:
-            details = " | ".join(registration_details)
-            return False, f"Domain {domain} is registered ({details})"
+    return _DOMAIN_RE.fullmatch(domain) is not None
+
+def _canon(domain):
+    """
+    Return the lowercase ASCII (punycode) form of domain, so müller.de and
+    xn--mller-kva.de share one cache entry and one WHOIS query.
+    """
+    import idna
+    return idna.encode(domain.strip().lower(), uts46=True).decode()
+
+def _first(value):
+    # WHOIS fields come back as a list when the record repeats them
+    if isinstance(value, list):
+        return value[0] if value else None
+    return value
+
+def _describe_registration(domain, domain_info, now=None):
+    if domain_info.domain_name is None:
+        return True, f"Domain {domain} appears to be available (No domain record found)"
+    # Read each field once; python-whois serves them through a Python-level __getattr__
+    creation_date = _first(domain_info.creation_date)
+    expiration_date = _first(domain_info.expiration_date)
+    registrar = domain_info.registrar
+    name_servers = domain_info.name_servers
+    status = getattr(domain_info, 'status', None)
+    # (label, value) pairs, formatted in one pass at the end
+    parts = []
+    if isinstance(creation_date, datetime):
+        parts.append(("Created", creation_date.date().isoformat()))
+    if isinstance(expiration_date, datetime):
+        expires = expiration_date.date().isoformat()
+        parts.append(("Expires", expires))
+        if expiration_date.tzinfo is None:
+            # WHOIS timestamps without an offset are UTC
+            expiration_date = expiration_date.replace(tzinfo=timezone.utc)
+        if expiration_date < (now or datetime.now(timezone.utc)):
+            return _Result(True, f"Domain {domain} expired on {expires} and may be available for registration",
+                           **dict(parts), Registrar=registrar)
+    if registrar:
+        parts.append(("Registrar", registrar))
+    if name_servers:
+        # A single server may come back as a bare string; lists and sets are counted
+        ns_count = 1 if isinstance(name_servers, str) else len(name_servers)
+        parts.append(("Nameservers", f"{ns_count} configured"))
+    if status:
+        if isinstance(status, list):
+            statuses = ", ".join(status[:2])
+            if len(status) > 2:
+                statuses += f" and {len(status)-2} more"
         else:
-            return False, f"Domain {domain} appears to be registered, but limited details are available"
-    except whois.parser.PywhoisError as e:
-        error_msg = str(e)
-        if any(phrase in error_msg.lower() for phrase in [
-            "no match for", "no entries found", "not found", "no data found","no match","domain not found","domain available"]):
-            return True, f"Domain {domain} appears to be available (WHOIS response: {error_msg.split('.')[0]})"
-        if any(phrase in error_msg.lower() for phrase in ["redacted for privacy", "registration private", "data protected"]):
-            return False, f"Domain {domain} is registered with privacy protection"
-        return False, f"Error checking {domain}: {error_msg}"
+            statuses = status
+        parts.append(("Status", statuses))
+    if parts:
+        details = " | ".join(f"{label}: {value}" for label, value in parts)
+        return _Result(False, f"Domain {domain} is registered ({details})", **dict(parts))
+    else:
+        return False, f"Domain {domain} appears to be registered, but limited details are available"
+
+def _describe_whois_error(domain, error_msg):
+    lowered = error_msg.lower()
+    if any(phrase in lowered for phrase in _AVAIL_PHRASES):
+        return True, f"Domain {domain} appears to be available (WHOIS response: {error_msg.split('.')[0]})"
+    if any(phrase in lowered for phrase in _PRIV_PHRASES):
+        return False, f"Domain {domain} is registered with privacy protection"
+    return False, f"Error checking {domain}: {error_msg}"
+
+class VerisignWhois:
+    """
+    Queries Verisign's registry WHOIS directly, one connection per query.
+    Skips python-whois's referral to the registrar's server; the registry
+    answer alone says whether the domain exists.
+    """
+    HOST = "whois.verisign-grs.com"
+    PORT = 43
+    # The only registries this server answers for; .cc, .tv and .name have their own
+    TLDS = frozenset({"com", "net"})
+
+    def __init__(self, timeout=WHOIS_TIMEOUT):
+        self.timeout = timeout
+
+    @staticmethod
+    def _request(domain):
+        return f"domain {domain}\r\n".encode()
+
+    def query(self, domain):
+        # The registry closes the connection after each answer (RFC 3912), so
+        # every query gets its own socket. Reading stops at the ">>> ... <<<"
+        # update marker; only legal boilerplate follows it.
+        with socket.create_connection((self.HOST, self.PORT), timeout=self.timeout) as sock:
+            sock.sendall(self._request(domain))
+            buf = b""
+            while b"<<<" not in buf:
+                chunk = sock.recv(4096)
+                if not chunk:
+                    break
+                buf += chunk
+        return buf.decode("utf-8", errors="replace")
+
+    async def aquery(self, domain):
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(self.HOST, self.PORT), timeout=self.timeout)
+        try:
+            writer.write(self._request(domain))
+            await writer.drain()
+            buf = b""
+            while b"<<<" not in buf:
+                chunk = await reader.read(4096)
+                if not chunk:
+                    break
+                buf += chunk
+        finally:
+            writer.close()
+        return buf.decode("utf-8", errors="replace")
+
+_VERISIGN = VerisignWhois()
+
+def _registry_date(value):
+    # Verisign timestamps look like 1997-09-15T04:00:00Z
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+def _describe_verisign(domain, response, now=None):
+    if "No match for" in response:
+        return True, f"Domain {domain} appears to be available (WHOIS response: No match for {_cache_key(domain)})"
+    fields = defaultdict(list)
+    for match in _VERISIGN_FIELD_RE.finditer(response):
+        fields[match["field"]].append(match["value"].strip())
+    if not fields["Domain Name"]:
+        return False, f"Error checking {domain}: unexpected registry response: {response.strip()[:80]}"
+    domain_info = SimpleNamespace(
+        domain_name=fields["Domain Name"][0],
+        creation_date=[_registry_date(v) for v in fields["Creation Date"]],
+        expiration_date=[_registry_date(v) for v in fields["Registry Expiry Date"]],
+        registrar=fields["Registrar"][0] if fields["Registrar"] else None,
+        name_servers=fields["Name Server"],
+        # "clientTransferProhibited https://icann.org/epp#clientTransferProhibited"
+        status=[v.split()[0] for v in fields["Domain Status"]],
+    )
+    return _describe_registration(domain, domain_info, now)
+
+def _tld(domain):
+    return domain.rsplit(".", 1)[-1]
+
+def _extractor():
+    global _EXTRACT
+    if _EXTRACT is None:
+        # Worker threads all reach here at once on a cold start; without the
+        # lock each would build (and parse the suffix list into) its own
+        with _extract_lock:
+            if _EXTRACT is None:
+                import tldextract
+                extract = tldextract.TLDExtract(suffix_list_urls=(), cache_dir=None)
+                extract("example.com")  # parse the bundled list now, under the lock
+                _EXTRACT = extract
+    return _EXTRACT
+
+@lru_cache(maxsize=4096)
+def _cache_key(domain):
+    return _extractor()(domain).top_domain_under_public_suffix or domain
+
+def _open_disk_cache():
+    global _disk_cache
+    if _disk_cache is None:
+        try:
+            _disk_cache = shelve.open(str(CACHE_PATH))
+            atexit.register(_close_disk_cache)
+        except Exception:
+            # Unwritable home directory etc. - keep going with the in-memory cache only
+            _disk_cache = {}
+    return _disk_cache
+
+def _close_disk_cache():
+    # Drop expired entries so the file doesn't keep every domain ever checked
+    if _disk_cache_dirty:
+        cutoff = time.time() - CACHE_TTL
+        try:
+            for key in list(_disk_cache.keys()):
+                entry = _disk_get(key)
+                if entry is not None and entry[0] <= cutoff:
+                    del _disk_cache[key]
+        except Exception:
+            pass
+    _disk_cache.close()
+
+def _disk_get(key):
+    # An entry that can't be read back (damaged file, pickle from another
+    # version) counts as a miss and is thrown away
+    disk = _open_disk_cache()
+    try:
+        entry = disk.get(key)
+        if entry is not None:
+            # Check the shape too, not just that it unpickles
+            timestamp, domain, (is_available, message) = entry
+        return entry
+    except Exception:
+        try:
+            del disk[key]
+        except Exception:
+            pass
+        return None
+
+def _remember(key, entry):
+    # Caller holds _cache_lock
+    _WHOIS_CACHE[key] = entry
+    _WHOIS_CACHE.move_to_end(key)
+    if len(_WHOIS_CACHE) > CACHE_MAX_ENTRIES:
+        _WHOIS_CACHE.popitem(last=False)
+
+def _cache_get(domain):
+    key = _cache_key(domain)
+    with _cache_lock:
+        entry = _WHOIS_CACHE.get(key)
+        if entry is None:
+            entry = _disk_get(key)
+        if entry is None:
+            return None
+        if time.time() - entry[0] >= CACHE_TTL:
+            _WHOIS_CACHE.pop(key, None)
+            try:
+                del _open_disk_cache()[key]
+            except Exception:
+                pass
+            return None
+        _remember(key, entry)
+    timestamp, cached_domain, result = entry
+    return _rebind(result, cached_domain, domain)
+
+def _rebind(result, looked_up, domain):
+    # Sibling subdomains share the registered domain's WHOIS record
+    if looked_up == domain:
+        return result
+    is_available, message = result
+    return _Result(is_available, message.replace(looked_up, domain, 1), **getattr(result, "details", {}))
+
+def _is_error(domain, result):
+    return result[1].startswith(f"Error checking {domain}")
+
+def _cache_put(domain, result):
+    # Lookup errors are usually transient, so only definite answers are cached
+    if _is_error(domain, result):
+        return
+    global _disk_cache_dirty
+    key = _cache_key(domain)
+    entry = (time.time(), domain, result)
+    with _cache_lock:
+        _remember(key, entry)
+        _open_disk_cache()[key] = entry
+        _disk_cache_dirty = True
+
+def _reserve_tld_slot(domain):
+    # Book the next free slot for this TLD and return how long to wait for it
+    tld = _tld(domain)
+    with _rate_lock:
+        now = time.monotonic()
+        slot = max(now, _NEXT_QUERY[tld])
+        _NEXT_QUERY[tld] = slot + _TLD_MIN_INTERVAL.get(tld, DEFAULT_MIN_INTERVAL)
+    return slot - now
+
+def clear_cache():
+    """
+    Forget all cached WHOIS results, both in memory and on disk.
+    """
+    with _cache_lock:
+        _WHOIS_CACHE.clear()
+        _open_disk_cache().clear()
+
+def check_domain_availability(domain, now=None):
+    result = _cache_get(domain)
+    if result is not None:
+        return result
+    key = _cache_key(domain)
+    with _cache_lock:
+        pending = _in_flight.get(key)
+        owner = pending is None
+        if owner:
+            pending = _in_flight[key] = Future()
+    if not owner:
+        looked_up, result = pending.result()
+        return _rebind(result, looked_up, domain)
+    try:
+        # Another thread may have finished this key between our two checks
+        result = _cache_get(domain)
+        if result is None:
+            result = _lookup_domain(domain, now)
+            _cache_put(domain, result)
+    except BaseException as e:
+        pending.set_exception(e)
+        raise
+    else:
+        pending.set_result((domain, result))
+    finally:
+        with _cache_lock:
+            del _in_flight[key]
+    return result
+
+def _whois_server(domain):
+    import whois
+    suffix = _cache_key(domain).split(".", 1)[-1]
+    server = _WHOIS_SERVERS.get(suffix)
+    if server is None:
+        server = _WHOIS_SERVERS[suffix] = whois.NICClient().choose_server(domain)
+    return server
+
+def _query_whois(domain):
+    """
+    Fetch the raw WHOIS text for domain, following the registrar referral.
+    Throttled or failed queries are retried with exponential backoff.
+    """
+    import whois
+    query = _cache_key(domain)
+    server = _whois_server(query)
+    if server is None:
+        raise whois.exceptions.PywhoisError(f"No WHOIS server known for {domain}")
+    delay = WHOIS_RETRY_DELAY
+    for attempt in range(WHOIS_RETRIES + 1):
+        last_attempt = attempt == WHOIS_RETRIES
+        try:
+            text = whois.NICClient().whois(query, server, whois.NICClient.WHOIS_RECURSE, quiet=True,
+                                           timeout=WHOIS_TIMEOUT, ignore_socket_errors=False)
+        except OSError:
+            if last_attempt:
+                raise
+        else:
+            if not _RATE_LIMIT_RE.search(text, 0, 300):
+                return text
+            if last_attempt:
+                # A throttle notice has no domain record in it; parsing it
+                # would report (and cache) the domain as available
+                raise whois.exceptions.PywhoisError(
+                    f"rate limited by {server} after {WHOIS_RETRIES} retries")
+        time.sleep(delay)
+        delay *= 2
+
+def _bootstrap_rdap():
+    # IANA's RDAP bootstrap data is kept on disk and refreshed once a week
+    import whoisit
+    saved = None
+    try:
+        saved = RDAP_BOOTSTRAP_PATH.read_text()
+        whoisit.load_bootstrap_data(saved)
+        if not whoisit.bootstrap_is_older_than(RDAP_BOOTSTRAP_MAX_AGE):
+            return True
+    except Exception:
+        saved = None
+    whoisit.clear_bootstrapping()
+    try:
+        whoisit.bootstrap()
+    except Exception:
+        whoisit.clear_bootstrapping()
+        if saved is None:
+            return False
+        # Offline: week-old endpoints beat none at all
+        whoisit.load_bootstrap_data(saved)
+        return True
+    try:
+        RDAP_BOOTSTRAP_PATH.write_text(whoisit.save_bootstrap_data())
+    except OSError:
+        pass
+    return True
+
+def _rdap_ready():
+    global _rdap_available
+    with _rdap_lock:
+        if _rdap_available is None:
+            _rdap_available = _bootstrap_rdap()
+        return _rdap_available
+
+def _rdap_lookup(domain, now=None):
+    """
+    Look domain up over RDAP. Returns None when WHOIS should be used instead:
+    the TLD has no RDAP service, or its server failed to answer.
+    """
+    if not _rdap_ready():
+        return None
+    import whoisit
+    try:
+        # The registry's answer has everything we report; skip the registrar hop
+        info = whoisit.domain(_cache_key(domain), follow_related=False)
+    except whoisit.errors.ResourceDoesNotExist:
+        return True, f"Domain {domain} appears to be available (RDAP: no such domain)"
+    except Exception:
+        return None
+    registrars = info.get("entities", {}).get("registrar") or [{}]
+    domain_info = SimpleNamespace(
+        domain_name=info.get("name") or None,
+        creation_date=info.get("registration_date"),
+        expiration_date=info.get("expiration_date"),
+        registrar=registrars[0].get("name"),
+        name_servers=info.get("nameservers"),
+        status=info.get("status"),
+    )
+    return _describe_registration(domain, domain_info, now)
+
+def _dns_is_registered(domain):
+    # NS records for the registered domain mean it is delegated, hence registered.
+    # NXDOMAIN says nothing certain (registered domains can be parked without NS).
+    import dns.resolver
+    try:
+        dns.resolver.resolve(_cache_key(domain), "NS", lifetime=DNS_TIMEOUT)
+        return True
+    except dns.resolver.NXDOMAIN:
+        return False
+    except Exception:
+        return None
+
+async def _dns_is_registered_async(domain):
+    import dns.asyncresolver
+    import dns.resolver
+    try:
+        await dns.asyncresolver.resolve(_cache_key(domain), "NS", lifetime=DNS_TIMEOUT)
+        return True
+    except dns.resolver.NXDOMAIN:
+        return False
+    except Exception:
+        return None
+
+def _merge_dns(domain, result, dns_registered):
+    # A delegated domain is registered whatever WHOIS said; keep the WHOIS
+    # details when there are any, but don't report it available or failed
+    if not dns_registered:
+        return result
+    if _is_error(domain, result):
+        return False, f"Domain {domain} is registered (found in DNS; WHOIS details unavailable)"
+    if result[1].startswith(f"Domain {domain} appears to be available"):
+        return False, f"Domain {domain} is registered (found in DNS, though WHOIS returned no record)"
+    return result
+
+def _lookup_domain(domain, now=None):
+    dns_probe = _DNS_EXECUTOR.submit(_dns_is_registered, domain)
+    result = _whois_lookup(domain, now)
+    return _merge_dns(domain, result, dns_probe.result())
+
+def _whois_lookup(domain, now=None):
+    # Imported here: python-whois compiles its per-TLD parsers at import time,
+    # which would slow down `--help` and cache hits for nothing
+    import whois
+    time.sleep(_reserve_tld_slot(domain))
+    try:
+        if _tld(domain) in VerisignWhois.TLDS:
+            return _describe_verisign(domain, _VERISIGN.query(_cache_key(domain)), now)
+        result = _rdap_lookup(domain, now)
+        if result is not None:
+            return result
+        text = _query_whois(domain)
+        if not text:
+            raise whois.exceptions.PywhoisError("Whois command returned no output")
+        domain_info = whois.parser.WhoisEntry.load(_cache_key(domain), text)
+        return _describe_registration(domain, domain_info, now)
+    except whois.exceptions.PywhoisError as e:
+        return _describe_whois_error(domain, str(e))
+    except Exception as e:
+        error_type = type(e).__name__
+        return False, f"Error checking {domain}: {error_type} - {str(e)}"
+
+async def check_domain_availability_async(domain, sem, now=None):
+    """
+    Asynchronous variant of check_domain_availability built on asyncwhois.
+    At most sem's worth of lookups are in flight at once.
+    """
+    result = _cache_get(domain)
+    if result is not None:
+        return result
+    key = _cache_key(domain)
+    pending = _in_flight_async.get(key)
+    if pending is not None:
+        # Shielded so a cancelled waiter doesn't cancel the shared lookup
+        looked_up, result = await asyncio.shield(pending)
+        return _rebind(result, looked_up, domain)
+    pending = _in_flight_async[key] = asyncio.get_running_loop().create_future()
+    try:
+        result = await _lookup_domain_async(domain, sem, now)
+        _cache_put(domain, result)
+    except asyncio.CancelledError:
+        pending.cancel()
+        raise
+    except BaseException as e:
+        pending.set_exception(e)
+        raise
+    else:
+        pending.set_result((domain, result))
+    finally:
+        del _in_flight_async[key]
+    return result
+
+async def _lookup_domain_async(domain, sem, now=None):
+    # The DNS probe is cheap UDP and not rate-limited; run it alongside WHOIS
+    dns_task = asyncio.create_task(_dns_is_registered_async(domain))
+    result = await _whois_lookup_async(domain, sem, now)
+    return _merge_dns(domain, result, await dns_task)
+
+async def _whois_lookup_async(domain, sem, now=None):
+    import asyncwhois
+    # Wait for the TLD's slot before taking a semaphore slot, so other TLDs aren't held up
+    await asyncio.sleep(_reserve_tld_slot(domain))
+    try:
+        if _tld(domain) in VerisignWhois.TLDS:
+            async with sem:
+                response = await asyncio.wait_for(_VERISIGN.aquery(_cache_key(domain)), timeout=LOOKUP_TIMEOUT)
+            return _describe_verisign(domain, response, now)
+        if await asyncio.to_thread(_rdap_ready):
+            try:
+                async with sem:
+                    result = await asyncio.wait_for(asyncio.to_thread(_rdap_lookup, domain, now), timeout=LOOKUP_TIMEOUT)
+            except asyncio.TimeoutError:
+                result = None
+            if result is not None:
+                return result
+        async with sem:
+            _, parser_output = await asyncio.wait_for(
+                asyncwhois.aio_whois(domain, timeout=WHOIS_TIMEOUT, tldextract_obj=_extractor()),
+                timeout=LOOKUP_TIMEOUT)
+        # Map asyncwhois keys onto the python-whois attribute names
+        domain_info = SimpleNamespace(
+            domain_name=parser_output.get("domain_name"),
+            creation_date=parser_output.get("created"),
+            expiration_date=parser_output.get("expires"),
+            registrar=parser_output.get("registrar"),
+            name_servers=parser_output.get("name_servers"),
+            status=parser_output.get("status"),
+        )
+        return _describe_registration(domain, domain_info, now)
+    except asyncwhois.WhoIsError as e:
+        return _describe_whois_error(domain, str(e))
+    except asyncio.TimeoutError:
+        return False, f"Error checking {domain}: TimeoutError - no WHOIS response within {LOOKUP_TIMEOUT}s"
     except Exception as e:
         error_type = type(e).__name__
         return False, f"Error checking {domain}: {error_type} - {str(e)}"
 
-def print_colored(text, color_code):
+def _run(coro):
+    """
+    Run coro to completion, on uvloop's faster event loop when it's installed.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    return uvloop.run(coro)
+
+async def _check_all(domains, concurrency):
+    sem = asyncio.Semaphore(concurrency)
+    # One timestamp for the whole batch; expiry is judged at day granularity anyway
+    now = datetime.now(timezone.utc)
+    return await asyncio.gather(*[check_domain_availability_async(d, sem, now) for d in domains])
+
+def check_domains(domains, concurrency=MAX_CONCURRENT_LOOKUPS):
+    """
+    Check a batch of domains concurrently.
+    Returns a list of (is_available, message) tuples in input order.
+    """
+    return _run(_check_all(domains, concurrency))
+
+def print_colored(text, color_code, file=None):
     """
     Print colored text to the console.
     """
-    print(f"\033[{color_code}m{text}\033[0m")
+    print(f"\033[{color_code}m{text}\033[0m", file=file)
+
+_COLORS = {"ok": b"\x1b[1;32m", "err": b"\x1b[1;31m", "warn": b"\x1b[1;33m", "info": b"\x1b[1;36m"}
+_RESET = b"\x1b[0m\n"
+
+class _ResultWriter:
+    """
+    Collects colored result lines in a bytearray and writes them to stdout
+    every OUTPUT_FLUSH_LINES lines, or whenever the caller runs out of
+    results that are ready to show.
+    """
+    def __init__(self):
+        self.buf = bytearray()
+        self.lines = 0
+        # Results reported so far; still right after a Ctrl+C
+        self.reported = 0
+        self.encoding = sys.stdout.encoding or "utf-8"
+
+    # Progress and summary text; goes to stdout alongside the results
+    status_file = None
+
+    def emit(self, color, text):
+        self.buf.extend(_COLORS[color])
+        self.buf.extend(text.encode(self.encoding, errors="replace"))
+        self.buf.extend(_RESET)
+        self._line_done()
+
+    def _line_done(self):
+        self.lines += 1
+        if self.lines >= OUTPUT_FLUSH_LINES:
+            self.flush()
+
+    def result(self, domain, result, prefix=""):
+        is_available, message = result
+        if is_available:
+            self.emit("ok", f"{prefix}✓ {message}")
+        else:
+            self.emit("err", f"{prefix}✗ {message}")
+
+    def flush(self):
+        # Anything print()ed earlier must come out first
+        sys.stdout.flush()
+        out = getattr(sys.stdout, "buffer", None)
+        if out is None:
+            sys.stdout.write(self.buf.decode(self.encoding))
+            sys.stdout.flush()
+        else:
+            out.write(self.buf)
+            out.flush()
+        self.buf.clear()
+        self.lines = 0
+
+class _JsonWriter(_ResultWriter):
+    """
+    Writes one JSON object per result (NDJSON) for piping into other tools;
+    everything else goes to stderr so stdout stays machine-readable.
+    """
+    status_file = sys.stderr
+
+    def __init__(self):
+        import orjson
+        super().__init__()
+        self.dumps = orjson.dumps
+
+    def result(self, domain, result, prefix=""):
+        is_available, message = result
+        details = getattr(result, "details", {})
+        self.buf.extend(self.dumps({
+            "domain": domain,
+            "available": is_available,
+            "created": details.get("Created"),
+            "expires": details.get("Expires"),
+            "registrar": details.get("Registrar"),
+            "message": message,
+        }))
+        self.buf.extend(b"\n")
+        self._line_done()
+
+def _split_domains(text):
+    return [d for d in re.split(r'[\s,]+', text.strip()) if d]
+
+def _valid_domains(domains, file=None):
+    """
+    Canonicalize domains, reporting and dropping any that are malformed.
+    """
+    import idna
+    valid = []
+    for domain in domains:
+        try:
+            canon = _canon(domain)
+        except idna.IDNAError as e:
+            print_colored(f"Invalid domain name: {domain} ({e})", "1;31", file)
+            continue
+        if validate_domain(canon):
+            valid.append(canon)
+        else:
+            print_colored(f"Invalid domain format: {domain}", "1;31", file)
+    if not valid:
+        print("Domain should match pattern: example.com, sub.example.net, etc.", file=file)
+    return valid
+
+def _report(writer, domain, result, available_domains, prefix=""):
+    writer.result(domain, result, prefix)
+    writer.reported += 1
+    if result[0]:
+        available_domains.append(domain)
+
+def _run_batch(domains, available_domains, writer):
+    valid = _valid_domains(domains, writer.status_file)
+    if not valid:
+        return
+    print_colored(f"Checking {', '.join(valid)}...", "1;33", writer.status_file)
+    _run(_report_all(valid, available_domains, writer))
+
+async def _report_all(domains, available_domains, writer):
+    """
+    Check domains concurrently, reporting each result as it completes.
+    """
+    sem = asyncio.Semaphore(MAX_CONCURRENT_LOOKUPS)
+    now = datetime.now(timezone.utc)
+    pending = {asyncio.ensure_future(check_domain_availability_async(d, sem, now)): d for d in domains}
+    try:
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                _report(writer, pending.pop(task), task.result(), available_domains)
+            writer.flush()
+    finally:
+        writer.flush()
+        for task in pending:
+            task.cancel()
+
+def _run_threaded(domains, workers, available_domains, writer):
+    """
+    Check domains on a thread pool, reporting each result as it completes.
+    Threads hitting the same TLD wait on its rate-limit slot, not on each other.
+    """
+    global _DNS_EXECUTOR
+    valid = _valid_domains(domains, writer.status_file)
+    if not valid:
+        return
+    total = len(valid)
+    print_colored(f"Checking {total} domains with {workers} workers...", "1;33", writer.status_file)
+    # One probe thread per worker, so no worker waits on another's DNS query
+    _DNS_EXECUTOR = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dns-probe")
+    executor = ThreadPoolExecutor(max_workers=workers)
+    now = datetime.now(timezone.utc)
+    completed = SimpleQueue()
+    futures = {}
+    for domain in valid:
+        future = executor.submit(check_domain_availability, domain, now)
+        futures[future] = domain
+        future.add_done_callback(completed.put)
+    try:
+        for done in range(1, total + 1):
+            future = completed.get()
+            _report(writer, futures[future], future.result(), available_domains, f"[{done}/{total}] ")
+            # Write out as soon as no further result is waiting, so slow runs still show progress
+            if completed.empty():
+                writer.flush()
+    finally:
+        writer.flush()
+        # On Ctrl+C drop whatever hasn't started instead of draining the queue
+        executor.shutdown(wait=False, cancel_futures=True)
+
+def _read_domain_file(path):
+    with open(path, encoding="utf-8") as f:
+        return _split_domains(f.read())
+
+async def _handle(domain, sem, writer, available_domains):
+    result = await check_domain_availability_async(domain, sem)
+    _report(writer, domain, result, available_domains)
+    writer.flush()
+
+async def _repl(available_domains):
+    """
+    Prompt for domains while earlier lookups are still running; each result
+    is printed above the prompt as soon as it arrives.
+    Returns the number of domains checked.
+    """
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
+    from prompt_toolkit.completion import WordCompleter
+    from prompt_toolkit.history import FileHistory
+    from prompt_toolkit.patch_stdout import patch_stdout
+    seen = []
+    session = PromptSession(
+        history=FileHistory(str(HISTORY_PATH)),
+        auto_suggest=AutoSuggestFromHistory(),
+        completer=WordCompleter(lambda: seen),
+    )
+    sem = asyncio.Semaphore(MAX_CONCURRENT_LOOKUPS)
+    writer = _ResultWriter()
+    pending = set()
+    checked_domains = 0
+    with patch_stdout(raw=True):
+        while True:
+            try:
+                line = await session.prompt_async("\nEnter domain to check (e.g., example.com): ")
+            except KeyboardInterrupt:
+                print_colored("\n\nSearch interrupted by user.", "1;33")
+                for task in pending:
+                    task.cancel()
+                break
+            except EOFError:
+                line = "quit"
+            line = line.strip().lower()
+            if line in ('quit', 'exit', 'q'):
+                if pending:
+                    print_colored(f"Waiting for {len(pending)} lookups still in progress...", "1;33")
+                    await asyncio.gather(*pending)
+                break
+            domains = _split_domains(line)
+            if not domains:
+                print("Please enter a domain name")
+                continue
+            for domain in _valid_domains(domains):
+                print_colored(f"Checking {domain}...", "1;33")
+                checked_domains += 1
+                if domain not in seen:
+                    seen.append(domain)
+                task = asyncio.create_task(_handle(domain, sem, writer, available_domains))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+    return checked_domains
+
+def _print_summary(checked_domains, available_domains, file=None):
+    print_colored("\n=== Domain Lookup Summary ===", "1;36", file)
+    print(f"Domains checked: {checked_domains}", file=file)
+    print(f"Available domains found: {len(available_domains)}", file=file)
+    if available_domains:
+        print_colored("\nAvailable Domains:", "1;32", file)
+        for domain in available_domains:
+            print(f"  - {domain}", file=file)
 
 def main():
     """
     Main function to run the domain lookup tool.
     """
+    parser = argparse.ArgumentParser(prog="domain-lookup", description="Check domain availability with WHOIS.")
+    parser.add_argument("domains", nargs="*", help="domains to check in one batch (also read from piped stdin)")
+    parser.add_argument("-f", "--file", help="read domains to check from a file, one per line")
+    parser.add_argument("-w", "--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"parallel lookups when checking a file (default: {DEFAULT_WORKERS})")
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument("--json", dest="format", action="store_const", const="json",
+                        help="print batch results as JSON lines (default when stdout is not a terminal)")
+    output.add_argument("--text", dest="format", action="store_const", const="text",
+                        help="print batch results as colored text (default on a terminal)")
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    available_domains = []
+    checked_domains = 0
+    batch_format = args.format or ("text" if sys.stdout.isatty() else "json")
+    writer = _JsonWriter() if batch_format == "json" else _ResultWriter()
+    if args.file:
+        try:
+            domains = _read_domain_file(args.file) + args.domains
+        except OSError as e:
+            parser.error(f"cannot read {args.file}: {e.strerror}")
+        try:
+            _run_threaded(domains, args.workers, available_domains, writer)
+        except KeyboardInterrupt:
+            print_colored("\n\nSearch interrupted by user.", "1;33", writer.status_file)
+        _print_summary(writer.reported, available_domains, writer.status_file)
+        return
+    if args.domains or not sys.stdin.isatty():
+        domains = list(args.domains)
+        if not domains:
+            domains = _split_domains(sys.stdin.read())
+        try:
+            _run_batch(domains, available_domains, writer)
+        except KeyboardInterrupt:
+            print_colored("\n\nSearch interrupted by user.", "1;33", writer.status_file)
+        _print_summary(writer.reported, available_domains, writer.status_file)
+        return
     print_colored("\n=== Domain Availability Checker ===", "1;36")
     print("Enter domain names to check (type 'quit' or 'exit' to finish)")
+    print("Several domains separated by spaces or commas are checked together")
+    print("You can keep typing while earlier lookups are still running")
     print("Press Ctrl+C to exit at any time\n")
-    available_domains = []
-    checked_domains = 0
     try:
-        while True:
-            domain = input("\nEnter domain to check (e.g., example.com): ").strip().lower()
-            if domain.lower() in ('quit', 'exit', 'q'):
-                break
-            if not domain:
-                print("Please enter a domain name")
-                continue
-            if not validate_domain(domain):
-                print_colored(f"Invalid domain format: {domain}", "1;31")
-                print("Domain should match pattern: example.com, sub.example.net, etc.")
-                continue
-            print_colored(f"Checking {domain}...", "1;33")
-            checked_domains += 1
-            time.sleep(0.5)
-            is_available, message = check_domain_availability(domain)
-            if is_available:
-                print_colored(f"✓ {message}", "1;32")
-                available_domains.append(domain)
-            else:
-                print_colored(f"✗ {message}", "1;31")
+        checked_domains = _run(_repl(available_domains))
     except KeyboardInterrupt:
         print_colored("\n\nSearch interrupted by user.", "1;33")
-    print_colored("\n=== Domain Lookup Summary ===", "1;36")
-    print(f"Domains checked: {checked_domains}")
-    print(f"Available domains found: {len(available_domains)}")
-    if available_domains:
-        print_colored("\nAvailable Domains:", "1;32")
-        for domain in available_domains:
-            print(f"  - {domain}")
+    _print_summary(checked_domains, available_domains)
     print_colored("\nThank you for using the Domain Availability Checker!", "1;36")
-